@@ -1,18 +1,16 @@
 import pygame
 from load_image import LoadImage
+import display  # noqa: F401  window must exist before convert()/convert_alpha()
 import sys
 
 width, height = 1080, 720
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("The Running Zombie")
 
 white = (255, 255, 255)
 red = (255, 0, 0)
 black = (0, 0, 0)
 
-pygame.display.set_icon(LoadImage.icon)
-background1 = pygame.transform.scale(LoadImage.background1, (1080, 720))
-death_screen = pygame.transform.scale(LoadImage.death_screen, (1080, 720))
+background1 = pygame.transform.scale(LoadImage.background1, (1080, 720)).convert()
+death_screen = pygame.transform.scale(LoadImage.death_screen, (1080, 720)).convert()
 
 
 class AfterDeath:
@@ -21,13 +19,20 @@ class AfterDeath:
         self.restart_button_rect = None
         self.screen = screen
         self.background = background
-        self.restart_button = pygame.transform.scale(restart_button, (200, 210))
-        self.exit_button = pygame.transform.scale(exit_button, (200, 210))
-        self.restart_button_scaled = self.restart_button.copy()
-        self.exit_button_scaled = self.exit_button.copy()
+        self.restart_button = pygame.transform.scale(restart_button, (200, 210)).convert_alpha()
+        self.exit_button = pygame.transform.scale(exit_button, (200, 210)).convert_alpha()
         self.selected_button = None
         self.button_hover_scale = 1.1
-        
+        self.restart_button_hover = pygame.transform.scale(self.restart_button, (
+            int(self.restart_button.get_width() * self.button_hover_scale),
+            int(self.restart_button.get_height() * self.button_hover_scale)))
+        self.exit_button_hover = pygame.transform.scale(self.exit_button, (
+            int(self.exit_button.get_width() * self.button_hover_scale),
+            int(self.exit_button.get_height() * self.button_hover_scale)))
+        self.restart_button_scaled = self.restart_button
+        self.exit_button_scaled = self.exit_button
+        self.clock = pygame.time.Clock()
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -57,26 +62,26 @@ class AfterDeath:
         self.exit_button_rect = self.exit_button.get_rect(topright=(1000, 500))
 
         selected_action = None
+        hovered = object()
 
         while selected_action is None:
+            self.clock.tick(60)
             selected_action = self.handle_events()
 
             x, y = pygame.mouse.get_pos()
             if self.restart_button_rect.collidepoint(x, y):
                 self.selected_button = "restart"
-                self.restart_button_scaled = pygame.transform.scale(self.restart_button, (
-                    int(self.restart_button.get_width() * self.button_hover_scale),
-                    int(self.restart_button.get_height() * self.button_hover_scale)))
+                self.restart_button_scaled = self.restart_button_hover
             elif self.exit_button_rect.collidepoint(x, y):
                 self.selected_button = "exit"
-                self.exit_button_scaled = pygame.transform.scale(self.exit_button, (
-                    int(self.exit_button.get_width() * self.button_hover_scale),
-                    int(self.exit_button.get_height() * self.button_hover_scale)))
+                self.exit_button_scaled = self.exit_button_hover
             else:
                 self.selected_button = None
-                self.restart_button_scaled = self.restart_button.copy()
-                self.exit_button_scaled = self.exit_button.copy()
+                self.restart_button_scaled = self.restart_button
+                self.exit_button_scaled = self.exit_button
 
-            self.draw()
+            if self.selected_button != hovered:
+                hovered = self.selected_button
+                self.draw()
 
         return selected_action
@@ -1,31 +1,22 @@
 import random
 import pygame
 from load_image import LoadImage
-from menu import Menu
-from player import Player
 from weapons import KineticWeapon, Rocket, Bombs
-
-pygame.init()
+import display  # noqa: F401  window must exist before convert()/convert_alpha()
 
 width, height = 1080, 720
 bomb_types = ["rocket", "nuke", "regular", "frozen", "fire", "poison", "vork"]
 
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("The Running Zombie")
-
 white = (255, 255, 255)
 red = (255, 0, 0)
 black = (0, 0, 0)
-player = Player()
-pygame.display.set_icon(LoadImage.icon)
-background1 = pygame.transform.scale(LoadImage.background1, (width, height))
-death_screen = pygame.transform.scale(LoadImage.death_screen, (width, height))
+background1 = pygame.transform.scale(LoadImage.background1, (width, height)).convert()
+death_screen = pygame.transform.scale(LoadImage.death_screen, (width, height)).convert()
 
 bombs_group = pygame.sprite.Group()
 explosion_group = pygame.sprite.Group()
 all_sprites = pygame.sprite.Group()
 
-menu = Menu(screen, LoadImage.menu_image, LoadImage.start_button, LoadImage.exit_button)
 
 
 class BombsManager:
@@ -45,8 +36,9 @@ class BombsManager:
         kinetic_weapon_y = 0
         self.spawn_kinetic_weapons(kinetic_weapon_x, kinetic_weapon_y)
         self.kinetic_weapon_spawn_chance = 10
-        self.last_spawn_time = {bomb_type: 0 for bomb_type in self.bomb_types}
-        self.spawn_delay = {bomb_type: 0 for bomb_type in self.bomb_types}
+        self.frame = 0
+        self.last_spawn_frame = {bomb_type: 0 for bomb_type in self.bomb_types}
+        self.spawn_delay_frames = {bomb_type: 0 for bomb_type in self.bomb_types}
         self.camera_x = 0
         self.kinetic_weapon_spawn_chance = 10
         self.selected_bomb_type = None
@@ -71,14 +63,14 @@ class BombsManager:
         if bomb_type == "vork":
             self.spawn_kinetic_weapons(x, y)
         else:
-            if pygame.time.get_ticks() - self.last_spawn_time[bomb_type] >= self.spawn_delay[bomb_type]:
+            if self.frame - self.last_spawn_frame[bomb_type] >= self.spawn_delay_frames[bomb_type]:
                 if bomb_type == "rocket":
                     self.spawn_rocket(x, y)
                 else:
                     bomb = Bombs(self.player, bomb_type, mouse_position)
                     self.all_sprites.add(bomb)
                     self.bombs_group.add(bomb)
-                self.last_spawn_time[bomb_type] = pygame.time.get_ticks()
+                self.last_spawn_frame[bomb_type] = self.frame
 
     def spawn_kinetic_weapons(self, x, y):
         if self.selected_bomb.get_selected_bomb() == "vork":
@@ -93,8 +85,7 @@ class BombsManager:
         self.weapons_group.add(rocket)
 
     def update(self):
-        for bomb in self.bombs_group:
-            bomb.update(self.camera_x)
+        self.frame += 1
 
         if self.is_bomb_selected:
             if self.selected_bomb_type == "rocket":
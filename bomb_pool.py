@@ -0,0 +1,39 @@
+import numpy as np
+
+from physics import integrate
+from weapons import Bombs
+
+width, height = 1080, 720
+
+
+class BombPool:
+    def __init__(self, capacity=32):
+        self.bombs = []
+        self.data = np.zeros((capacity, 3), dtype=np.float32)
+
+    def sync(self, bombs_group):
+        alive = [bomb for bomb in bombs_group.sprites() if isinstance(bomb, Bombs)]
+        if alive == self.bombs:
+            return
+
+        if len(alive) > len(self.data):
+            self.data = np.zeros((len(alive) * 2, 3), dtype=np.float32)
+
+        for index, bomb in enumerate(alive):
+            self.data[index, 0] = bomb.rect.y
+            self.data[index, 1] = bomb.speed
+            self.data[index, 2] = height - bomb.rect.height
+            bomb.pooled = True
+
+        self.bombs = alive
+
+    def step(self):
+        count = len(self.bombs)
+        if count == 0:
+            return
+
+        active = self.data[:count]
+        integrate(active)
+
+        for index, bomb in enumerate(self.bombs):
+            bomb.rect.y = int(active[index, 0])
@@ -0,0 +1,9 @@
+import pygame
+from load_image import LoadImage
+
+width, height = 1080, 720
+
+pygame.init()
+screen = pygame.display.set_mode((width, height))
+pygame.display.set_caption("The Running Zombie")
+pygame.display.set_icon(LoadImage.icon)
@@ -1,21 +1,16 @@
 import pygame
-from load_image import LoadImage
-from bomb_manager import BombsManager
-
-pygame.init()
+from load_image import LoadImage, fetch
+from physics import dist_sq
+import display  # noqa: F401  window must exist before convert()/convert_alpha()
 
 width, height = 1080, 720
 bomb_types = ["rocket", "nuke", "regular", "frozen", "fire", "poison", "vork"]
 
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("The Running Zombie")
-
 white = (255, 255, 255)
 red = (255, 0, 0)
 black = (0, 0, 0)
-pygame.display.set_icon(LoadImage.icon)
-background1 = pygame.transform.scale(LoadImage.background1, (width, height))
-death_screen = pygame.transform.scale(LoadImage.death_screen, (width, height))
+background1 = pygame.transform.scale(LoadImage.background1, (width, height)).convert()
+death_screen = pygame.transform.scale(LoadImage.death_screen, (width, height)).convert()
 
 bombs_group = pygame.sprite.Group()
 explosion_group = pygame.sprite.Group()
@@ -23,9 +18,35 @@ all_sprites = pygame.sprite.Group()
 kinetic_weapons_group = pygame.sprite.Group()
 weapons_group = pygame.sprite.Group()
 
+_EXPLOSION_FRAMES = {}
+
+
+def _explosion_frames(paths, size):
+    key = (tuple(paths), size)
+    frames = _EXPLOSION_FRAMES.get(key)
+    if frames is None:
+        frames = [
+            pygame.transform.smoothscale(fetch(image_path).convert_alpha(), size)
+            for image_path in paths
+        ]
+        _EXPLOSION_FRAMES[key] = frames
+    return frames
+
+
 class Explosion(pygame.sprite.Sprite):
     TARGET_SIZE = (150, 150)
 
+    TYPE_PARAMS = {
+        "normal": (LoadImage.explosion_files, 90, 10),
+        "regular": (LoadImage.explosion_files, 90, 50),
+        "rocket": (LoadImage.explosion_files, 90, 50),
+        "nuke": (LoadImage.nuke, 250, 50),
+        "frozen": (LoadImage.frozen_bomb, 90, 0),
+        "poison": (LoadImage.poison_bomb, 90, 0),
+        "burn": (LoadImage.burn, 90, 0),
+        "fire": (LoadImage.burn, 90, 0),
+    }
+
     def __init__(self, x, y, player, explosion_type, damage_amount=0):
         super().__init__()
 
@@ -36,14 +57,13 @@ class Explosion(pygame.sprite.Sprite):
         self.kinetic_weapons_group = kinetic_weapons_group
         self.weapons_group = weapons_group
         self.bomb_types = bomb_types
-        self.bombs_manager = BombsManager(self.player, self.all_sprites, self.bombs_group, self.kinetic_weapons_group,
-                                          self.weapons_group, self.bomb_types)
         self.explosion_type = explosion_type
-        self.animation_delay = 100
+        self.frames_per_image = 6
+        self.frame_counter = 0
         self.animation_counter = 0
-        self.animation_start_time = pygame.time.get_ticks()
         self.finished = False
         self.distance_threshold = 0
+        self.distance_threshold_sq = 0
         self.damage_amount = 0
         self.images = []
         self.camera_x = 0
@@ -59,53 +79,30 @@ class Explosion(pygame.sprite.Sprite):
             self.rect = pygame.Rect(x, y, 0, 0)
             self.image = pygame.Surface((0, 0))
 
+    @classmethod
+    def preload(cls):
+        for explosion_images, _, _ in cls.TYPE_PARAMS.values():
+            _explosion_frames(explosion_images, cls.TARGET_SIZE)
+
     def load_explosion_images(self):
-        if self.explosion_type == "normal" or self.explosion_type == "regular" or self.explosion_type == "rocket":
-            explosion_images = LoadImage.explosion_files
-            self.distance_threshold = 90
-            self.damage_amount = 10 if self.explosion_type == "normal" else 50
-        elif self.explosion_type == "nuke":
-            explosion_images = LoadImage.nuke
-            self.distance_threshold = 250
-            self.damage_amount = 50
-        elif self.explosion_type == "frozen":
-            explosion_images = LoadImage.frozen_bomb
-            self.distance_threshold = 90
-            self.damage_amount = 0
-        elif self.explosion_type == "poison":
-            explosion_images = LoadImage.poison_bomb
-            self.distance_threshold = 90
-            self.damage_amount = 0
-        elif self.explosion_type == "burn" or self.explosion_type == "fire":
-            explosion_images = LoadImage.burn
-            self.distance_threshold = 90
-            self.damage_amount = 0
-        elif self.explosion_type == "vork" and hasattr(LoadImage, "vork_explosion"):
-            explosion_images = LoadImage.vork_explosion
-            self.distance_threshold = 0
-            self.damage_amount = 0
-        else:
+        params = self.TYPE_PARAMS.get(self.explosion_type)
+        if params is None and self.explosion_type == "vork" and hasattr(LoadImage, "vork_explosion"):
+            params = (LoadImage.vork_explosion, 0, 0)
+        if params is None:
             print(f"Unknown explosion_type: {self.explosion_type}")
             return
 
-        original_images = [
-            pygame.image.load(image_path).convert_alpha()
-            for image_path in explosion_images
-        ]
-
-        self.images = [
-            pygame.transform.smoothscale(img, Explosion.TARGET_SIZE)
-            for img in original_images
-        ]
+        explosion_images, self.distance_threshold, self.damage_amount = params
+        self.distance_threshold_sq = self.distance_threshold * self.distance_threshold
+        self.images = _explosion_frames(explosion_images, Explosion.TARGET_SIZE)
 
     def update(self, camera_x):
         self.camera_x = camera_x
-        current_time = pygame.time.get_ticks()
-        elapsed_time = current_time - self.animation_start_time
+        self.frame_counter += 1
 
-        if elapsed_time >= self.animation_delay:
+        if self.frame_counter >= self.frames_per_image:
+            self.frame_counter = 0
             self.animation_counter += 1
-            self.animation_start_time = current_time
 
         if self.animation_counter < len(self.images):
             self.image = self.images[self.animation_counter]
@@ -124,19 +121,16 @@ class Explosion(pygame.sprite.Sprite):
         if self.finished and self.rect.bottom >= height:
             self.kill()
 
-    def draw(self, screen):
-        screen.blit(self.image, (self.rect.x - self.camera_x, self.rect.y))
-
     def handle_collisions(self):
         if self.player:
             player_rect = self.player.rect
             player_center_x = player_rect.centerx
             player_bottom = player_rect.bottom
 
-            distance_squared = (player_center_x - self.rect.centerx) ** 2 + (
-                    player_bottom - self.rect.bottom) ** 2
+            distance_squared = dist_sq(player_center_x, player_bottom,
+                                       self.rect.centerx, self.rect.bottom)
 
-            if distance_squared <= self.distance_threshold ** 2:
+            if distance_squared <= self.distance_threshold_sq:
                 self.handle_player_collision()
 
             bombs_hit = pygame.sprite.spritecollide(self, self.bombs_group, False)
@@ -144,16 +138,18 @@ class Explosion(pygame.sprite.Sprite):
                 if bomb != self:
                     bomb.handle_explosion_collision()
 
+    STATUS_EFFECTS = {
+        "frozen": ("frozen", "frozen_duration", 5),
+        "poison": ("poison", "poison_duration", 5),
+        "burn": ("burn", "burn_duration", 10),
+    }
+
     def handle_player_collision(self):
-        if self.explosion_type == "frozen":
-            self.player.frozen = True
-            self.player.frozen_duration = 5
-        elif self.explosion_type == "poison":
-            self.player.poison = True
-            self.player.poison_duration = 5
-        elif self.explosion_type == "burn":
-            self.player.burn = True
-            self.player.burn_duration = 10
+        effect = self.STATUS_EFFECTS.get(self.explosion_type)
+        if effect is not None:
+            flag, duration_attr, duration = effect
+            setattr(self.player, flag, True)
+            setattr(self.player, duration_attr, duration)
         elif self.explosion_type == "vork":
             self.player.slow_duration = 420
             self.player.slow_start_time = pygame.time.get_ticks()
@@ -3,7 +3,7 @@ import math
 from menu import Menu
 from after_death import AfterDeath
 from level import Level
-from load_image import LoadImage
+from load_image import LoadImage, preload
 from player import Player
 from weapons import KineticWeapon, Rocket, Bombs
 from explosion import Explosion
@@ -11,6 +11,10 @@ from intro import Intro
 from gui import Gui
 from bomb_manager import BombsManager, SelectedBomb
 from load_screen import LoadScreen
+from display import screen
+from sprite_groups import FastGroup
+from bomb_pool import BombPool
+from spatial_grid import SpatialHashGrid
 import pygame.mixer
 
 pygame.mixer.init()
@@ -18,27 +22,36 @@ pygame.mixer.init()
 
 width, height = 1080, 720
 
+movement_keys = {pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE}
+
 
 class GameLoop:
     def __init__(self, width, height):
-        pygame.init()
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        preload(
+            LoadImage.playerwalk + LoadImage.playerstand + LoadImage.playerdie
+            + LoadImage.explosion_files + LoadImage.nuke + LoadImage.frozen_bomb
+            + LoadImage.poison_bomb + LoadImage.burn
+            + list(LoadImage.bomb_files.values())
+        )
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((width, height))
+        self.screen = screen
         self.bomb_types = ["rocket", "nuke", "regular", "frozen", "fire", "poison", "vork"]
-        self.all_sprites = pygame.sprite.Group()
-        self.bombs_group = pygame.sprite.Group()
+        self.all_sprites = FastGroup()
+        self.bombs_group = FastGroup()
+        self.bomb_pool = BombPool()
+        self.spatial_grid = SpatialHashGrid()
         self.kinetic_weapons_group = pygame.sprite.Group()
         self.weapons_group = pygame.sprite.Group()
-        pygame.display.set_caption("The Running Zombie")
         self.selected_bomb_type = "regular"
-        self.game_state = "load_screen"
         self.load_screen = LoadScreen()
         self.current_level_number = 1
         self.current_level = Level(self.current_level_number, "playing")
         self.start_x = 0
         self.start_y = 0
         self.player = Player()
+        self.all_sprites.add(self.player)
         self.bomb_button_positions = [
             (1020, 50),
             (1020, 150),
@@ -51,12 +64,12 @@ class GameLoop:
         self.selected_bomb = SelectedBomb()
         self.gui = Gui(self.player, self.bomb_button_positions, self.bomb_types)
         self.bombs_manager = BombsManager(self.player, self.all_sprites, self.bombs_group, self.kinetic_weapons_group, self.weapons_group, self.bomb_types)
-        self.explosion_group = pygame.sprite.Group()
+        self.explosion_group = FastGroup()
+        Explosion.preload()
         self.menu = Menu(self.screen, LoadImage.menu_image, LoadImage.start_button, LoadImage.exit_button)
-        self.after_death = AfterDeath(
-            self.screen, LoadImage.death_screen, LoadImage.restart_button, LoadImage.exit_button
-        )
+        self.after_death = None
         self.death_animation_started = False
+        self.dirty = True
         self.running = True
         self.clock = pygame.time.Clock()
         self.camera_x = 0
@@ -68,7 +81,6 @@ class GameLoop:
         self.background_changed = False
         self.time_of_death = 0
         self.target_group = pygame.sprite.Group()
-        self.game_state = "intro"
         self.intro = Intro(self.screen, 'intro.mp4', "sounds\intro_sound.mp3")
         self.game_state = "menu"
 
@@ -76,7 +88,7 @@ class GameLoop:
         self.game_state = "playing"
         self.background_changed = False
         self.player = Player()
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = FastGroup()
         self.all_sprites.add(self.player)
 
     def run(self):
@@ -85,24 +97,34 @@ class GameLoop:
 
     def menu_loop(self):
         selected_action = None
+        hovered = object()
         while selected_action != "start":
+            self.clock.tick(60)
             selected_action = self.menu.handle_events()
-            self.menu.draw()
-            pygame.display.flip()
+            if self.menu.selected_button != hovered:
+                hovered = self.menu.selected_button
+                self.menu.draw()
+                pygame.display.flip()
 
         self.game_loop()
 
     def game_loop(self):
+        timestep = 16
+        accumulator = 0
         while self.running:
+            accumulator = min(accumulator + self.clock.tick(60), 3 * timestep)
             self.handle_events()
-            self.draw_game()
-            self.update_game(self.camera_x)
-            self.all_sprites.draw(self.screen)
-            pygame.display.flip()
-            self.clock.tick(60)
+            while accumulator >= timestep:
+                self.update_game(self.camera_x)
+                self.dirty = True
+                accumulator -= timestep
+            if self.dirty:
+                self.draw_game()
+                pygame.display.flip()
+                self.dirty = False
 
             if not self.running:
-                self.after_death.draw()
+                self.get_after_death().draw()
                 pygame.display.flip()
 
             if self.player.score == 100:
@@ -114,13 +136,18 @@ class GameLoop:
 
     def handle_events(self):
         for event in pygame.event.get():
+            self.dirty = True
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mouse_x, mouse_y = pygame.mouse.get_pos()
                 self.handle_bomb_placement(mouse_x, mouse_y)
             elif event.type == pygame.KEYDOWN:
+                if event.key in movement_keys:
+                    self.player.keys_down.add(event.key)
                 self.handle_bomb_selection(event.key)
+            elif event.type == pygame.KEYUP:
+                self.player.keys_down.discard(event.key)
 
     def handle_bomb_placement(self, mouse_x, mouse_y):
         if self.selected_bomb_type == "rocket":
@@ -152,9 +179,21 @@ class GameLoop:
 
     def draw_game(self):
         current_background = self.current_level.get_current_background()
-        self.screen.blit(current_background, (-self.camera_x, 0))
-
-        self.all_sprites.draw(self.screen)
+        background_width = current_background.get_width()
+        if background_width > self.width:
+            view_x = max(0, min(int(self.camera_x), background_width - self.width))
+            view = current_background.subsurface((view_x, 0, self.width, self.height))
+            draws = [(view, (0, 0))]
+        else:
+            draws = [(current_background, (-self.camera_x, 0))]
+        draws.extend((sprite.image, sprite.rect) for sprite in self.all_sprites
+                     if sprite.rect.right > 0 and sprite.rect.left < self.width)
+        draws.extend((bomb.image, bomb.screen_rect) for bomb in self.bombs_group
+                     if bomb.screen_rect.right > 0 and bomb.screen_rect.left < self.width)
+        draws.extend((explosion.image, (explosion.rect.x - explosion.camera_x, explosion.rect.y))
+                     for explosion in self.explosion_group
+                     if -explosion.rect.width < explosion.rect.x - explosion.camera_x < self.width)
+        self.screen.blits(draws)
 
         if self.game_state == "playing":
             self.gui.draw_health_bar()
@@ -162,17 +201,8 @@ class GameLoop:
             self.gui.draw_bomb_buttons()
             self.gui.draw_exit_button()
 
-        for bomb in self.bombs_group:
-            bomb.draw(self.screen, self.camera_x)
-
-        for explosion in self.explosion_group:
-            explosion.draw(self.screen)
-
         self.player.draw(self.screen)
 
-        self.gui.draw_point_score()
-        self.gui.draw_bomb_buttons()
-
     def update_game(self, camera_x):
         self.current_level.update_background()
 
@@ -188,23 +218,34 @@ class GameLoop:
             self.current_level.update_background()
             self.background_changed = True
 
-        self.bombs_group.update(self.camera_x)
+        self.bomb_pool.sync(self.bombs_group)
+        self.bomb_pool.step()
+
+        for bomb in self.bombs_group:
+            if bomb.rect.top > self.height:
+                bomb.kill()
+            elif (-50 <= bomb.rect.x - self.camera_x <= self.width + 50
+                    and bomb.rect.y < self.height + 50):
+                bomb.update(self.camera_x)
 
         self.bombs_manager.update()
 
         self.handle_death()
 
-        for bomb in self.bombs_group:
-            bomb.update(self.camera_x)
-            if bomb.rect.colliderect(self.player.rect):
-                explosion = Explosion(bomb.rect.centerx, bomb.rect.bottom, self.player, bomb.bomb_type)
-                self.explosion_group.add(explosion)
+        self.spatial_grid.rebuild(self.bombs_group, self.kinetic_weapons_group)
+        self.player.nearby_dangers = self.spatial_grid.query(self.player.rect.inflate(256, 256))
+        bombs = [sprite for sprite in self.spatial_grid.query(self.player.rect)
+                 if self.bombs_group.has(sprite)]
+        hit_indices = self.player.rect.collidelistall([bomb.rect for bomb in bombs])
+        for index in hit_indices:
+            bomb = bombs[index]
+            explosion = Explosion(bomb.rect.centerx, bomb.rect.bottom, self.player, bomb.bomb_type)
+            self.explosion_group.add(explosion)
+            bomb.kill()
 
         for explosion in self.explosion_group:
             explosion.update(self.camera_x)
 
-        self.player.update(self.camera_x, self.bombs_group, self.kinetic_weapons_group)
-
         if self.player.is_dying and not self.death_animation_started:
             self.death_animation_started = True
             self.game_state = "death_animation"
@@ -215,16 +256,10 @@ class GameLoop:
             pass
 
         self.all_sprites.update(self.camera_x, self.bombs_group, self.kinetic_weapons_group)
-        self.gui.draw_health_bar()
-        self.gui.draw_point_score()
-        self.all_sprites.draw(self.screen)
 
         if self.should_change_level():
             self.load_level()
 
-        pygame.display.flip()
-        self.clock.tick(60)
-
     def prepare_for_new_level(self):
         self.current_level_number += 1
         self.background_changed = False
@@ -285,20 +320,25 @@ class GameLoop:
         if current_time - self.time_of_death >= self.death_animation_duration:
             self.player.animate_death()
     
+    def get_after_death(self):
+        if self.after_death is None:
+            self.after_death = AfterDeath(
+                self.screen, LoadImage.death_screen, LoadImage.restart_button, LoadImage.exit_button
+            )
+        return self.after_death
+
     def death_screen(self):
-        selected_action = self.after_death.run()
+        after_death = self.get_after_death()
+        selected_action = after_death.run()
         if selected_action == "restart":
             self.start_game()
         elif selected_action == "exit":
             self.running = False
         else:
-            self.after_death.draw()
+            after_death.draw()
             pygame.display.flip()
             self.clock.tick(60)
 
 width, height = 1080, 720
 game_loop = GameLoop(width, height)
-game_loop.intro.play_intro()
-player = Player()
 game_loop.run()
-    
\ No newline at end of file
@@ -1,12 +1,11 @@
 import pygame
 import time
 from bomb_manager import SelectedBomb
+from load_image import load
+from display import screen
 
 width, height = 1080, 720
 
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("The Running Zombie")
-
 bomb_types = ["rocket", "nuke", "regular", "frozen", "fire", "poison", "vork"]
 
 
@@ -23,9 +22,10 @@ class Gui:
         self.bomb_types = bomb_types
         self.selected_bomb_color = (255, 255, 255)
         self.selected_bomb = SelectedBomb()
-        self.exit_button_image = pygame.transform.scale(
-            pygame.image.load("image/exit_button.png").convert_alpha(), (50, 50)
-        )
+        self.exit_button_image = load("image/exit_button.png", (50, 50))
+        self.bomb_button_images = {
+            bomb_type: load(f"image/{bomb_type}.png", (50, 50)) for bomb_type in bomb_types
+        }
 
     def draw_exit_button(self):
         self.screen.blit(self.exit_button_image, (10, 10))
@@ -56,11 +56,10 @@ class Gui:
 
     def draw_bomb_buttons(self):
         for index, (position, bomb_type) in enumerate(zip(self.bomb_button_positions, self.bomb_types)):
-            image_path = f"image/{bomb_type}.png"
-            bomb_image = pygame.image.load(image_path).convert_alpha()
-            bomb_image = pygame.transform.scale(bomb_image, (50, 50))
+            bomb_image = self.bomb_button_images[bomb_type]
 
             if self.selected_bomb == bomb_type:
+                bomb_image = bomb_image.copy()
                 bomb_image.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
 
             self.screen.blit(bomb_image, (position[0], position[1]))
@@ -1,56 +1,54 @@
 import pygame
+from load_image import load
 from player import Player
+from display import screen
 
 width, height = 1080, 720
-screen = pygame.display.set_mode((width, height))
+
+_BACKGROUND_CACHE = {}
+
+
+def _load_background(path):
+    background = _BACKGROUND_CACHE.get(path)
+    if background is None:
+        background = load(path, (1080, 720), alpha=False)
+        _BACKGROUND_CACHE[path] = background
+    return background
 
 
 class Level:
+    BACKGROUND_PATHS = [
+        "image/background.jpg",
+        "image/farm_d.jpeg",
+        "image/city_n.jpeg",
+        "image/pr_n.jpeg",
+        "image/wolf.jpg",
+        "image/nuke_map.jpg",
+        "image/swamp.jpeg",
+    ]
+
     def __init__(self, level_number, game_state="playing"):
         self.level_number = level_number
         self.game_state = game_state
         self.player = Player()
-        self.level_number = level_number
         self.screen = screen
-        self.background1 = pygame.transform.scale(pygame.image.load("image/background.jpg").convert_alpha(), (1080, 720))
-        self.background2 = pygame.transform.scale(pygame.image.load("image/farm_d.jpeg").convert_alpha(), (1080, 720))
-        self.background3 = pygame.transform.scale(pygame.image.load("image/city_n.jpeg").convert_alpha(), (1080, 720))
-        self.background4 = pygame.transform.scale(pygame.image.load("image/pr_n.jpeg").convert_alpha(), (1080, 720))
-        self.background5 = pygame.transform.scale(pygame.image.load("image/wolf.jpg").convert_alpha(), (1080, 720))
-        self.background6 = pygame.transform.scale(pygame.image.load("image/nuke_map.jpg").convert_alpha(), (1080, 720))
-        self.background7 = pygame.transform.scale(pygame.image.load("image/swamp.jpeg").convert_alpha(), (1080, 720))
 
         self.current_background_index = 0
-        self.current_background = self.background1
+        self.current_background = _load_background(self.BACKGROUND_PATHS[0])
         self.background_changed = False
 
     def update_background(self):
-        backgrounds = [self.background1, self.background2, self.background3, self.background4, self.background5,
-                       self.background6, self.background7]
-
-        self.current_background_index = (self.current_background_index + 1) % len(backgrounds)
-        self.current_background = backgrounds[self.current_background_index]
+        self.current_background_index = (self.current_background_index + 1) % len(self.BACKGROUND_PATHS)
+        self.current_background = _load_background(self.BACKGROUND_PATHS[self.current_background_index])
         print(f"Changed background to {self.current_background_index}")
 
         self.background_changed = True
 
     def get_current_background(self):
-        if self.level_number == 1:
-            return self.background1
-        elif self.level_number == 2:
-            return self.background2
-        elif self.level_number == 3:
-            return self.background3
-        elif self.level_number == 4:
-            return self.background4
-        elif self.level_number == 5:
-            return self.background5
-        elif self.level_number == 6:
-            return self.background6
-        elif self.level_number == 7:
-            return self.background7
-        else:
-            return pygame.Surface((1080, 720))
+        index = self.level_number - 1
+        if 0 <= index < len(self.BACKGROUND_PATHS):
+            return _load_background(self.BACKGROUND_PATHS[index])
+        return pygame.Surface((1080, 720))
 
     def should_change_level(self):
         return self.player.is_dying
@@ -1,4 +1,30 @@
 import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+_PRELOADED = {}
+
+
+def preload(paths, max_workers=4):
+    missing = [path for path in paths if path not in _PRELOADED]
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, surface in zip(missing, executor.map(pygame.image.load, missing)):
+                _PRELOADED[path] = surface
+
+
+def fetch(path):
+    surface = _PRELOADED.pop(path, None)
+    if surface is None:
+        surface = pygame.image.load(path)
+    return surface
+
+
+def load(path, size=None, alpha=True):
+    surface = fetch(path)
+    surface = surface.convert_alpha() if alpha else surface.convert()
+    if size is not None:
+        surface = pygame.transform.scale(surface, size)
+    return surface
 
 
 class LoadImage:
@@ -53,6 +79,14 @@ class LoadImage:
 
     healthbar = pygame.image.load("image/health.png")
 
+    bomb_files = {
+        "nuke": "image/nuke.png",
+        "regular": "image/regular.png",
+        "frozen": "image/frozen.png",
+        "fire": "image/fire.png",
+        "poison": "image/poison.png",
+    }
+
     explosion_files = [
         "image/explosion/tile000.png",
         "image/explosion/tile001.png",
@@ -1,12 +1,13 @@
 import pygame
+from load_image import load
+import display  # noqa: F401  window must exist before convert()/convert_alpha()
 
 width, height = 1080, 720
-screen = pygame.display.set_mode((width, height))
 
 
 class LoadScreen:
     def __init__(self):
-        self.load_screen_image = pygame.transform.scale(pygame.image.load("image/load_screen1.jpeg").convert_alpha(), (1080, 720))
+        self.load_screen_image = load("image/load_screen1.jpeg", (1080, 720), alpha=False)
 
     def show_load_screen(self, screen):
         screen.blit(self.load_screen_image, (0, 0))
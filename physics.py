@@ -0,0 +1,45 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def integrate(data):
+    np.minimum(data[:, 0] + data[:, 1], data[:, 2], out=data[:, 0])
+
+
+def clamp(value, low, high):
+    return low if value < low else high if value > high else value
+
+
+def dist_sq(ax, ay, bx, by):
+    return (ax - bx) * (ax - bx) + (ay - by) * (ay - by)
+
+
+def steer(target_x, target_y, rect_x, rect_y, speed):
+    dx = target_x - rect_x
+    dy = target_y - rect_y
+    distance_squared = dx * dx + dy * dy
+    if distance_squared <= 25.0:
+        return 0.0, 0.0
+    distance = math.sqrt(distance_squared)
+    scale = speed * (1.0 + distance * 0.01) / distance
+    return dx * scale, dy * scale
+
+
+if njit is not None:
+    clamp = njit(cache=True)(clamp)
+    dist_sq = njit(cache=True)(dist_sq)
+    steer = njit(cache=True)(steer)
+
+    @njit(cache=True)
+    def integrate(data):  # noqa: F811
+        for index in range(data.shape[0]):
+            position = data[index, 0] + data[index, 1]
+            if position > data[index, 2]:
+                position = data[index, 2]
+            data[index, 0] = position
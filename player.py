@@ -1,35 +1,59 @@
 import pygame
 import random
-from menu import Menu
-from load_image import LoadImage
+from load_image import LoadImage, fetch
+from physics import clamp, steer
+import display  # noqa: F401  window must exist before convert()/convert_alpha()
 import math
 
 width, height = 1080, 720
 
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("The Running Zombie")
-
 white = (255, 255, 255)
 red = (255, 0, 0)
 black = (0, 0, 0)
 
+_FRAME_CACHE = {}
+
+
+def _load_frames(paths, size=(100, 100)):
+    key = tuple(paths)
+    frames = _FRAME_CACHE.get(key)
+    if frames is None:
+        images = [pygame.transform.scale(fetch(filename).convert_alpha(), size)
+                  for filename in paths]
+        flipped = [pygame.transform.flip(image, True, False) for image in images]
+        frames = (images, flipped)
+        _FRAME_CACHE[key] = frames
+    return frames
+
 
 class Player(pygame.sprite.Sprite):
+    __slots__ = (
+        'score', 'walk_images', 'walk_images_left', 'death_images', 'death_images_left',
+        'playerstand_images', 'playerstand_images_left', 'image_index', 'image', 'rect',
+        'speed', 'jump_power', 'jump_velocity', 'is_jumping', 'animation_delay',
+        'animation_counter', 'facing_left', 'health', 'is_dying', 'idle_animation_delay',
+        'health_bar_full', 'health_bar_width', 'invincible', 'frozen', 'burn', 'poison',
+        'frozen_duration', 'slow_duration', 'burn_duration', 'poison_duration',
+        'poison_counter', 'slow_start_time', 'slow_counter', 'weapons', 'target_position',
+        '_max_x', '_max_y', 'nearby_dangers', 'keys_down', '_frames_until_next_jump',
+    )
+
     def __init__(self):
         super().__init__()
 
         self.score = 0
-        self.walk_images = [pygame.transform.scale(pygame.image.load(filename).convert_alpha(), (100, 100))
-                            for filename in LoadImage.playerwalk]
-        self.death_images = [pygame.transform.scale(pygame.image.load(filename).convert_alpha(), (100, 100))
-                             for filename in LoadImage.playerdie]
-        self.playerstand_images = [pygame.transform.scale(pygame.image.load(filename).convert_alpha(), (100, 100))
-                                   for filename in LoadImage.playerstand]
+        self.walk_images, self.walk_images_left = _load_frames(LoadImage.playerwalk)
+        self.death_images, self.death_images_left = _load_frames(LoadImage.playerdie)
+        self.playerstand_images, self.playerstand_images_left = _load_frames(LoadImage.playerstand)
 
         self.image_index = 0
         self.image = self.walk_images[self.image_index]
         self.rect = self.image.get_rect()
         self.rect.bottomleft = (width // -10, height - 2)
+        self._max_x = width - self.rect.width
+        self._max_y = height - self.rect.height
+        self.rect.x = clamp(self.rect.x, 0, self._max_x)
+        self.rect.y = clamp(self.rect.y, 0, self._max_y)
 
         self.speed = 10
         self.jump_power = 20
@@ -54,6 +78,9 @@ class Player(pygame.sprite.Sprite):
         self.poison_counter = 0
         self.weapons = pygame.sprite.Group()
         self.target_position = None
+        self.nearby_dangers = None
+        self.keys_down = set()
+        self._frames_until_next_jump = int(random.expovariate(1 / 100))
 
     def add_weapon(self, weapon):
         self.weapons.add(weapon)
@@ -65,26 +92,32 @@ class Player(pygame.sprite.Sprite):
             self.animate_death()
 
     def update(self, camera_x, bombs_group, kinetic_weapons_group):
-        keys = pygame.key.get_pressed()
-        any_key_pressed = any(keys)
+        any_key_pressed = bool(self.keys_down)
 
+        moved = False
         if not self.is_dying:
             if not any_key_pressed and not self.is_jumping:
-                self.avoid_dangers(bombs_group, kinetic_weapons_group)
+                moved = self.avoid_dangers(bombs_group, kinetic_weapons_group)
             else:
                 self.handle_movement()
                 self.handle_jumping()
+                moved = True
 
             self.animate_idle() if not any_key_pressed and not self.is_jumping else self.animate()
 
-        self.update_attributes()
+        self.update_attributes(moved)
         self.weapons.update(camera_x)
 
     def avoid_dangers(self, bombs_group, kinetic_weapons_group):
-        nearest_danger = self.find_nearest_danger(bombs_group, kinetic_weapons_group)
+        if self.nearby_dangers is not None:
+            nearest_danger = self.find_nearest_danger(self.nearby_dangers)
+        else:
+            nearest_danger = self.find_nearest_danger(bombs_group, kinetic_weapons_group)
 
         if nearest_danger:
             self.move_away_from_danger(nearest_danger)
+            return True
+        return False
 
     def find_nearest_danger(self, *danger_groups):
         nearest_danger = None
@@ -112,40 +145,28 @@ class Player(pygame.sprite.Sprite):
             new_x = self.rect.x - dx * self.speed
             new_y = self.rect.y - dy * self.speed
 
-            self.rect.x = max(0, min(new_x, width - self.rect.width))
-            self.rect.y = max(0, min(new_y, height - self.rect.height))
+            self.rect.x = max(0, min(new_x, self._max_x))
+            self.rect.y = max(0, min(new_y, self._max_y))
 
     def set_target_position(self, position):
         self.target_position = position
 
     def handle_movement(self):
-        print(f"Target Position: {self.target_position}")
         if self.target_position:
             target_x, target_y = self.target_position
-            dx = target_x - self.rect.x
-            dy = target_y - self.rect.y
-
-            distance = math.sqrt(dx ** 2 + dy ** 2)
-
-            threshold_distance = 5
-
-            if distance > threshold_distance:
-                print("Moving")
-                dx /= distance
-                dy /= distance
-
-                speed_factor = 1 + (distance / 100)
-
-                speed_x = dx * self.speed * speed_factor
-                speed_y = dy * self.speed * speed_factor
+            speed_x, speed_y = steer(target_x, target_y, self.rect.x, self.rect.y, self.speed)
 
+            if speed_x or speed_y:
                 self.rect.x += speed_x
                 self.rect.y += speed_y
 
     def handle_jumping(self):
-        if not self.is_jumping and random.randint(1, 100) == 1:
-            self.is_jumping = True
-            self.jump_velocity = self.jump_power
+        if not self.is_jumping:
+            self._frames_until_next_jump -= 1
+            if self._frames_until_next_jump <= 0:
+                self.is_jumping = True
+                self.jump_velocity = self.jump_power
+                self._frames_until_next_jump = int(random.expovariate(1 / 100))
 
         if self.is_jumping:
             self.jump_velocity -= 1
@@ -157,9 +178,13 @@ class Player(pygame.sprite.Sprite):
             self.jump_velocity -= 1
             self.rect.y -= self.jump_velocity
 
-    def update_attributes(self):
-        self.rect.x = max(0, min(self.rect.x, width - self.rect.width))
-        self.rect.y = max(0, min(self.rect.y, height - self.rect.height))
+    def update_attributes(self, moved=True):
+        if moved:
+            self.rect.x = clamp(self.rect.x, 0, self._max_x)
+            self.rect.y = clamp(self.rect.y, 0, self._max_y)
+
+            if self.rect.bottom > height:
+                self.rect.bottom = height
 
         if self.health < 0:
             self.health = 0
@@ -167,9 +192,6 @@ class Player(pygame.sprite.Sprite):
         if self.invincible:
             self.health = 20000
 
-        if self.rect.bottom > height:
-            self.rect.bottom = height
-
         if self.frozen:
             self.handle_frozen()
 
@@ -214,37 +236,26 @@ class Player(pygame.sprite.Sprite):
         if self.animation_counter >= self.animation_delay:
             self.animation_counter = 0
             self.image_index = (self.image_index + 1) % len(self.walk_images)
-            self.image = self.walk_images[self.image_index]
-
-            if self.facing_left:
-                self.image = pygame.transform.flip(self.image, True, False)
+            images = self.walk_images_left if self.facing_left else self.walk_images
+            self.image = images[self.image_index]
 
     def animate_idle(self):
         self.animation_counter += 1
         if self.animation_counter >= self.animation_delay:
             self.animation_counter = 0
             self.image_index = (self.image_index + 1) % len(self.playerstand_images)
-            self.image = self.playerstand_images[self.image_index]
-
-            if self.facing_left:
-                self.image = pygame.transform.flip(self.image, True, False)
+            images = self.playerstand_images_left if self.facing_left else self.playerstand_images
+            self.image = images[self.image_index]
 
     def animate_death(self):
         self.animation_counter += 1
         if self.animation_counter >= self.animation_delay:
             self.animation_counter = 0
             self.image_index = (self.image_index + 1) % len(self.death_images)
-            self.image = self.death_images[self.image_index]
-
-            if self.facing_left:
-                self.image = pygame.transform.flip(self.image, True, False)
+            images = self.death_images_left if self.facing_left else self.death_images
+            self.image = images[self.image_index]
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
 
         self.weapons.draw(screen)
-
-
-player = Player()
-
-menu = Menu(screen, LoadImage.menu_image, LoadImage.start_button, LoadImage.exit_button)
@@ -0,0 +1,32 @@
+class SpatialHashGrid:
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, sprite):
+        cell = self.cell_size
+        rect = sprite.rect
+        for cell_x in range(rect.left // cell, rect.right // cell + 1):
+            for cell_y in range(rect.top // cell, rect.bottom // cell + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append(sprite)
+
+    def rebuild(self, *groups):
+        self.clear()
+        for group in groups:
+            for sprite in group:
+                self.insert(sprite)
+
+    def query(self, rect):
+        cell = self.cell_size
+        found = []
+        seen = set()
+        for cell_x in range(rect.left // cell, rect.right // cell + 1):
+            for cell_y in range(rect.top // cell, rect.bottom // cell + 1):
+                for sprite in self.cells.get((cell_x, cell_y), ()):
+                    if id(sprite) not in seen:
+                        seen.add(id(sprite))
+                        found.append(sprite)
+        return found
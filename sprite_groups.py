@@ -0,0 +1,31 @@
+import pygame
+
+
+class FastGroup(pygame.sprite.Group):
+    def __init__(self, *sprites):
+        self._list = []
+        super().__init__(*sprites)
+
+    def sprites(self):
+        return list(self._list)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self._list.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._list.remove(sprite)
+
+    def _blit_pairs(self, surface, pairs):
+        if pairs:
+            fblits = getattr(surface, "fblits", None)
+            if fblits is not None:
+                fblits(pairs)
+            else:
+                surface.blits(pairs)
+        self.lostsprites = []
+        return self.lostsprites
+
+    def draw(self, surface):
+        return self._blit_pairs(surface, [(sprite.image, sprite.rect) for sprite in self._list])
@@ -1,35 +1,43 @@
 import random
 import pygame
-from load_image import LoadImage
-from menu import Menu
-from player import Player
+from load_image import LoadImage, load
+import display  # noqa: F401  window must exist before convert()/convert_alpha()
 import math
 
 
-pygame.init()
-
 width, height = 1080, 720
 bomb_types = ["rocket", "nuke", "regular", "frozen", "fire", "poison", "vork"]
 
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("The Running Zombie")
-
 white = (255, 255, 255)
 red = (255, 0, 0)
 black = (0, 0, 0)
-player = Player()
-pygame.display.set_icon(LoadImage.icon)
-background1 = pygame.transform.scale(LoadImage.background1, (width, height))
-death_screen = pygame.transform.scale(LoadImage.death_screen, (width, height))
+background1 = pygame.transform.scale(LoadImage.background1, (width, height)).convert()
+death_screen = pygame.transform.scale(LoadImage.death_screen, (width, height)).convert()
 
 bombs_group = pygame.sprite.Group()
 explosion_group = pygame.sprite.Group()
 all_sprites = pygame.sprite.Group()
 
-menu = Menu(screen, LoadImage.menu_image, LoadImage.start_button, LoadImage.exit_button)
+
+_BOMB_IMAGES = {}
+
+
+def _bomb_image(bomb_type):
+    image = _BOMB_IMAGES.get(bomb_type)
+    if image is None and bomb_type in LoadImage.bomb_files:
+        image = load(LoadImage.bomb_files[bomb_type], (60, 60))
+        _BOMB_IMAGES[bomb_type] = image
+    return image
 
 
 class Bombs(pygame.sprite.Sprite):
+    EXPLOSION_TYPES = {
+        "nuke": "nuke",
+        "frozen": "frozen",
+        "fire": "burn",
+        "poison": "poison",
+    }
+
     def __init__(self, player, bomb_type, mouse_position):
         super().__init__()
 
@@ -37,41 +45,38 @@ class Bombs(pygame.sprite.Sprite):
         self.bomb_type = bomb_type
         self.explosion_type = None
         self.exploded = False
-        self.image = pygame.Surface((1, 1))
+        self.image = pygame.Surface((60, 60))
         self.load_bomb_image()
         self.speed = 10
-        self.image = pygame.transform.scale(self.image, (60, 60))
         self.rect = self.image.get_rect()
         self.mouse_position = mouse_position
         x, y = self.mouse_position
         self.reset_bomb(start_x=x, start_y=0, speed=2)
+        self.screen_rect = self.rect.copy()
         self.time_since_landing = 0
         self.damage_amount = 0
+        self.pooled = False
 
     def load_bomb_image(self):
-        if self.bomb_type == "nuke":
-            self.image = pygame.image.load("image/nuke.png").convert_alpha()
-        elif self.bomb_type == "regular":
-            self.image = pygame.image.load("image/regular.png").convert_alpha()
-        elif self.bomb_type == "frozen":
-            self.image = pygame.image.load("image/frozen.png").convert_alpha()
-        elif self.bomb_type == "fire":
-            self.image = pygame.image.load("image/fire.png").convert_alpha()
-        elif self.bomb_type == "poison":
-            self.image = pygame.image.load("image/poison.png").convert_alpha()
+        image = _bomb_image(self.bomb_type)
+        if image is not None:
+            self.image = image
 
     def update(self, camera_x):
         if not self.exploded:
-            self.rect.y += self.speed
+            if not self.pooled:
+                self.rect.y += self.speed
 
             if self.rect.bottom >= height:
-                self.time_since_landing += 1
-            if self.time_since_landing >= 180:
-                self.exploded = True
-                self.explode()
-            if self.rect.bottom > height:
                 self.rect.bottom = height
-                
+                self.time_since_landing += 1
+                if self.time_since_landing >= 180:
+                    self.exploded = True
+                    self.explode()
+                    return
+
+        self.screen_rect = self.rect.move(-camera_x, 0)
+
     def draw(self, screen, camera_x):
         screen.blit(self.image, (self.rect.x - camera_x, self.rect.y))
 
@@ -82,7 +87,7 @@ class Bombs(pygame.sprite.Sprite):
         self.exploded = False
 
     def explode(self):
-        explosion_type = "nuke" if self.bomb_type == "nuke" else "normal"
+        explosion_type = self.EXPLOSION_TYPES.get(self.bomb_type, "normal")
         from explosion import Explosion
         explosion = Explosion(self.rect.centerx, self.rect.bottom, self.player, explosion_type, damage_amount=self.damage_amount)
         explosion_group.add(explosion)
@@ -108,6 +113,7 @@ class KineticWeapon(pygame.sprite.Sprite):
 
         self.rect.x = 1020
         self.rect.y = random.randint(50, height // 2)
+        self.screen_rect = self.rect.copy()
 
         self.player = player
         self.all_sprites = all_sprites
@@ -151,6 +157,8 @@ class KineticWeapon(pygame.sprite.Sprite):
         if self.rect.y == height - self.rect.height:
             self.speed = 0
 
+        self.screen_rect = self.rect.move(-camera_x, 0)
+
 
 class Rocket(pygame.sprite.Sprite):
     def __init__(self, player, all_sprites, weapons_group, target_group, x, y, bomb_type="rocket", scale_factor=0.3):
@@ -164,6 +172,7 @@ class Rocket(pygame.sprite.Sprite):
         self.explosion_radius = 50
         self.radius = 20
         self.rect = self.image.get_rect(topleft=(x, y))
+        self.screen_rect = self.rect.copy()
         self.target = None
         self.player = player
         self.all_sprites = all_sprites
@@ -207,7 +216,8 @@ class Rocket(pygame.sprite.Sprite):
     def draw(self, screen, camera_x):
         screen.blit(self.image, (self.rect.x - camera_x, self.rect.y))
 
-    def update(self):
+    def update(self, camera_x=0):
+        self.screen_rect = self.rect.move(-camera_x, 0)
         if not self.target:
             return
 
@@ -247,4 +257,4 @@ class Rocket(pygame.sprite.Sprite):
         if self.rect.bottom >= height and width:
             print("Rocket hit the ground!")
             self.explode()
-            self.kill()
\ No newline at end of file
+            self.kill()